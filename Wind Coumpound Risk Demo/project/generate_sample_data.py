@@ -6,12 +6,15 @@ Run once from the project root: python generate_sample_data.py
 
 import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 DATA_DIR = Path(__file__).parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-rng = np.random.default_rng(42)
+# One independent, non-overlapping stream per dataset builder
+SEED = 42
+CYCLONE_SEED, FIREWEATHER_SEED = np.random.SeedSequence(SEED).spawn(2)
 
 
 def _hours(start: str, days: int) -> pd.DatetimeIndex:
@@ -22,7 +25,8 @@ def _hours(start: str, days: int) -> pd.DatetimeIndex:
 # 1. Multi-day cyclone event  (8 days)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def make_cyclone(start="2024-03-01", days=8):
+def make_cyclone(start="2024-03-01", days=8, rng=None):
+    rng = np.random.default_rng(CYCLONE_SEED if rng is None else rng)
     idx = _hours(start, days)
     n = len(idx)
     hours = np.arange(n)
@@ -49,9 +53,9 @@ def make_cyclone(start="2024-03-01", days=8):
 
     df = pd.DataFrame({
         "timestamp": idx,
-        "wind_speed_ms": np.round(wind, 2),
-        "gust_ms": np.round(gust, 2),
-        "rainfall_mm": np.round(rainfall, 2),
+        "wind_speed_ms": np.round(wind, 2).astype(np.float32),
+        "gust_ms": np.round(gust, 2).astype(np.float32),
+        "rainfall_mm": np.round(rainfall, 2).astype(np.float32),
     })
     return df
 
@@ -60,7 +64,8 @@ def make_cyclone(start="2024-03-01", days=8):
 # 2. Fire-weather: dry + windy (7 days)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def make_fireweather(start="2024-11-15", days=7):
+def make_fireweather(start="2024-11-15", days=7, rng=None):
+    rng = np.random.default_rng(FIREWEATHER_SEED if rng is None else rng)
     idx = _hours(start, days)
     n = len(idx)
     hour_of_day = idx.hour.values
@@ -84,11 +89,11 @@ def make_fireweather(start="2024-11-15", days=7):
 
     df = pd.DataFrame({
         "timestamp": idx,
-        "wind_speed_ms": np.round(wind, 2),
-        "gust_ms": np.round(gust, 2),
-        "rainfall_mm": np.round(rainfall, 3),
-        "fuel_dryness_index": np.round(fdi, 3),
-        "infrastructure_vulnerability": np.round(0.4 + 0.3 * rng.random(n), 3),
+        "wind_speed_ms": np.round(wind, 2).astype(np.float32),
+        "gust_ms": np.round(gust, 2).astype(np.float32),
+        "rainfall_mm": np.round(rainfall, 3).astype(np.float32),
+        "fuel_dryness_index": np.round(fdi, 3).astype(np.float32),
+        "infrastructure_vulnerability": np.round(0.4 + 0.3 * rng.random(n), 3).astype(np.float32),
     })
     return df
 
@@ -97,11 +102,17 @@ def make_fireweather(start="2024-11-15", days=7):
 # 3. Future +10 % scenario (same base as cyclone, scaled up)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def make_future(start="2024-03-01", days=8, scale=1.10):
-    df = make_cyclone(start, days).copy()
-    df["wind_speed_ms"] = np.round(df["wind_speed_ms"] * scale, 2)
-    df["gust_ms"] = np.round(df["gust_ms"] * scale, 2)
-    return df
+def make_future(cyclone_df, scale=1.10):
+    # Scale the already-built cyclone so both datasets share the same draw.
+    # The input is the published 2 dp cyclone, so this rounds a second time:
+    # the future CSV is exactly the cyclone CSV x scale, to 2 dp.
+    out = cyclone_df.copy()
+    for col in ("wind_speed_ms", "gust_ms"):
+        # Scale in float64 from the 2 dp values the CSV holds, not from their
+        # float32 approximations, then store back as float32
+        base = np.round(out[col].to_numpy(dtype=np.float64), 2)
+        out[col] = np.round(base * scale, 2).astype(np.float32)
+    return out
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -109,15 +120,21 @@ def make_future(start="2024-03-01", days=8, scale=1.10):
 # ─────────────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    cyclone = make_cyclone()
+    # NumPy releases the GIL while filling random arrays, so the two random
+    # builders (each on its own spawned stream) run in parallel.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        cyclone_job = pool.submit(make_cyclone)
+        fireweather_job = pool.submit(make_fireweather)
+
+    cyclone = cyclone_job.result()
     cyclone.to_csv(DATA_DIR / "sample_cyclone_event.csv", index=False)
     print(f"✔  Cyclone dataset      ({len(cyclone)} rows)")
 
-    fireweather = make_fireweather()
+    fireweather = fireweather_job.result()
     fireweather.to_csv(DATA_DIR / "sample_wind_fireweather.csv", index=False)
     print(f"✔  Fire-weather dataset ({len(fireweather)} rows)")
 
-    future = make_future()
+    future = make_future(cyclone, scale=1.10)
     future.to_csv(DATA_DIR / "sample_future_plus10pct_winds.csv", index=False)
     print(f"✔  Future +10 % dataset ({len(future)} rows)")
 
@@ -11,11 +11,15 @@ Usage
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
 import pandas as pd
 
+# Headless Agg backend for the CLI unless the user picked one explicitly
+os.environ.setdefault("MPLBACKEND", "Agg")
+
 # ── ensure src/ is on path when running as a script ───────────────────────────
 SRC_DIR = Path(__file__).parent
 if str(SRC_DIR) not in sys.path:
@@ -24,7 +28,6 @@ if str(SRC_DIR) not in sys.path:
 import data_loader
 import metrics
 import risk_states
-import visualization
 
 PROJECT_ROOT = SRC_DIR.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -84,7 +87,9 @@ def run_dataset(csv_path: Path, label: str) -> None:
     # 3. Risk states
     daily = risk_states.compute_risk_states(daily)
 
-    # 4. Visualise (saves PNG to /output)
+    # 4. Visualise (saves PNG to /output); matplotlib is only imported here
+    import visualization
+
     visualization.plot_all(hourly, daily, title_prefix=label, output_dir=OUTPUT_DIR)
 
     # 5. Print summary
@@ -94,7 +99,7 @@ def run_dataset(csv_path: Path, label: str) -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     safe_label = label.replace(" ", "_").replace("/", "-")
     daily_out = OUTPUT_DIR / f"{safe_label}_daily_metrics.csv"
-    daily.to_csv(daily_out)
+    daily.to_csv(daily_out, float_format="%.4f", lineterminator="\n")
     print(f"  ✔ Saved daily metrics → {daily_out}")
 
 
@@ -20,6 +20,11 @@ Metric hierarchy
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; compute_all falls back to NumPy
+    njit = None
+
 # --- Constants ---
 BASELINE_WIND = 20.0        # m/s — daytime load baseline
 BASELINE_RECOVERY = 10.0    # m/s — overnight recovery baseline
@@ -29,6 +34,21 @@ SHWe_FAIL_NIGHT_THRESHOLD = 20.0
 # Recovery window hours (inclusive on left, exclusive on right)
 RECOVERY_HOURS = frozenset(range(0, 6)) | frozenset(range(22, 24))
 
+# Hour-of-day → in-recovery-window lookup table (index with an hour array)
+_REC_LUT = np.zeros(24, dtype=bool)
+_REC_LUT[list(RECOVERY_HOURS)] = True
+
+
+def _recovery_mask(index: pd.DatetimeIndex) -> np.ndarray:
+    """Boolean in-recovery-window mask for an index; NaT rows are never in recovery."""
+    nat = index.isna()
+    if not nat.any():
+        return _REC_LUT[index.hour.to_numpy()]
+    # .hour is float64 with NaN for NaT, which cannot index the table
+    mask = np.zeros(len(index), dtype=bool)
+    mask[~nat] = _REC_LUT[index.hour.to_numpy()[~nat].astype(np.intp)]
+    return mask
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Hourly metrics
@@ -49,23 +69,74 @@ def compute_shwe_hour(ews: pd.Series) -> pd.Series:
     Hourly above-recovery-baseline excess, but only during overnight
     recovery windows (00:00–06:00 and 22:00–24:00 local hour).
     """
-    in_recovery = ews.index.hour.isin(RECOVERY_HOURS)
+    in_recovery = _recovery_mask(ews.index)
     excess = (ews - BASELINE_RECOVERY).clip(lower=0)
     return excess.where(in_recovery, other=0.0)
 
 
+def _ews_cwl_shwe(wind, gust, in_recovery, out_ews, out_cwl, out_shwe):
+    """
+    Fused single-pass kernel for EWS, CWL_hour and SHWe_hour.
+
+    Mirrors compute_ews / compute_cwl_hour / compute_shwe_hour (NaN inputs
+    propagate the same way) and writes into preallocated float64 outputs.
+    """
+    for i in range(wind.size):
+        e = wind[i] + 0.3 * (gust[i] - wind[i])
+        out_ews[i] = e
+        out_cwl[i] = 0.0 if e <= BASELINE_WIND else e - BASELINE_WIND
+        if in_recovery[i]:
+            out_shwe[i] = 0.0 if e <= BASELINE_RECOVERY else e - BASELINE_RECOVERY
+        else:
+            out_shwe[i] = 0.0
+
+
+if njit is not None:
+    _ews_cwl_shwe = njit(cache=True)(_ews_cwl_shwe)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Daily aggregation helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _streak_nb(b):
+    """Sequential streak scan; compiled with Numba for long daily series."""
+    out = np.empty(b.size, np.int64)
+    c = 0
+    for i in range(b.size):
+        c = c + 1 if b[i] else 0
+        out[i] = c
+    return out
+
+
+if njit is not None:
+    _streak_nb = njit(cache=True)(_streak_nb)
+
+# Series length above which the compiled scan beats maximum.accumulate
+_STREAK_NUMBA_MIN = 10_000
+
+
 def _streak(bool_series: pd.Series) -> pd.Series:
     """Running streak of consecutive True values (resets to 0 on False)."""
-    streak = []
-    count = 0
-    for val in bool_series:
-        count = count + 1 if val else 0
-        streak.append(count)
-    return pd.Series(streak, index=bool_series.index)
+    b = bool_series.to_numpy(dtype=bool)
+    if njit is not None and b.size > _STREAK_NUMBA_MIN:
+        return pd.Series(_streak_nb(b), index=bool_series.index)
+    idx = np.arange(b.size)
+    # position just after the most recent False; the streak counts from there
+    reset = np.where(~b, idx + 1, 0)
+    base = np.maximum.accumulate(reset)
+    return pd.Series((idx + 1 - base) * b, index=bool_series.index)
+
+
+def _is_whole_day_hourly_grid(index: pd.DatetimeIndex) -> bool:
+    """True if the index is a gap-free hourly grid of whole (midnight-aligned) days."""
+    if len(index) == 0 or len(index) % 24 or index[0] != index[0].normalize():
+        return False
+    # Drop the tz first: to_numpy() on a tz-aware index is an object array of
+    # Timestamps, which makes the diff a Python-level loop. Wall-clock times
+    # also keep the 24-row blocks aligned with local days.
+    wall = index.tz_localize(None) if index.tz is not None else index
+    return bool((np.diff(wall.to_numpy()) == np.timedelta64(1, "h")).all())
 
 
 def compute_daily_metrics(hourly: pd.DataFrame) -> pd.DataFrame:
@@ -73,17 +144,57 @@ def compute_daily_metrics(hourly: pd.DataFrame) -> pd.DataFrame:
     Given an hourly DataFrame (with EWS, CWL_hour, SHWe_hour columns),
     return a daily summary DataFrame.
     """
-    date_key = hourly.index.normalize()   # truncate to midnight UTC
+    rec_mask = _recovery_mask(hourly.index)
+    ews = hourly["EWS"].to_numpy()
+
+    if _is_whole_day_hourly_grid(hourly.index):
+        # Fast path: each day is a contiguous 24-row block, so bucket with
+        # reduceat instead of hashing timestamps.
+        starts = np.arange(0, len(hourly), 24)
+        day_index = hourly.index[::24]
+        # nan_to_num / fmax keep groupby's skip-NaN semantics
+        daily_cwl = pd.Series(
+            np.add.reduceat(np.nan_to_num(hourly["CWL_hour"].to_numpy(), nan=0.0), starts),
+            index=day_index, name="daily_CWL",
+        )
+        daily_shwe = pd.Series(
+            np.add.reduceat(np.nan_to_num(hourly["SHWe_hour"].to_numpy(), nan=0.0), starts),
+            index=day_index, name="daily_SHWe",
+        )
+        max_ews_recovery = pd.Series(
+            np.fmax.reduceat(np.where(rec_mask, ews, 0.0), starts), index=day_index
+        )
+    else:
+        # Integer day number (days since epoch, local wall clock) as the
+        # group key instead of hashing normalize()d timestamps
+        tz = hourly.index.tz
+        wall = hourly.index.tz_localize(None) if tz is not None else hourly.index
+        wall = wall.to_numpy()
+        # NaT rows have no day (groupby(normalize()) drops them too)
+        valid = ~np.isnat(wall)
+        day_id = wall[valid].astype("datetime64[D]").astype(np.int64)
 
-    # --- daily CWL and SHWe sums ---
-    daily_cwl = hourly["CWL_hour"].groupby(date_key).sum().rename("daily_CWL")
-    daily_shwe = hourly["SHWe_hour"].groupby(date_key).sum().rename("daily_SHWe")
+        # --- daily CWL / SHWe sums and recovery-window EWS max in one pass ---
+        with_rec = hourly.assign(EWS_rec=np.where(rec_mask, ews, -np.inf))
+        if not valid.all():
+            with_rec = with_rec[valid]
+        agg = with_rec.groupby(day_id).agg(
+            daily_CWL=("CWL_hour", "sum"),
+            daily_SHWe=("SHWe_hour", "sum"),
+            max_ews_rec=("EWS_rec", "max"),
+        )
+        # back to midnight timestamps, once per day
+        agg.index = (
+            pd.DatetimeIndex(agg.index.to_numpy().astype("datetime64[D]"))
+            .as_unit(hourly.index.unit)
+            .tz_localize(tz)
+        )
+        daily_cwl = agg["daily_CWL"]
+        daily_shwe = agg["daily_SHWe"]
+        # days without any recovery-window hours count as recovered
+        max_ews_recovery = agg["max_ews_rec"].replace(-np.inf, 0.0)
 
     # --- no-recovery day: max EWS during recovery windows exceeds baseline ---
-    rec_mask = hourly.index.hour.isin(RECOVERY_HOURS)
-    ews_recovery = hourly.loc[rec_mask, "EWS"]
-    max_ews_recovery = ews_recovery.groupby(ews_recovery.index.normalize()).max()
-    max_ews_recovery = max_ews_recovery.reindex(daily_cwl.index, fill_value=0.0)
     no_recovery_day = (max_ews_recovery > BASELINE_RECOVERY).rename("no_recovery_day")
 
     # --- compound flags ---
@@ -140,10 +251,21 @@ def compute_all(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     hourly : pd.DataFrame  — original columns + EWS, CWL_hour, SHWe_hour
     daily  : pd.DataFrame  — daily aggregated metrics
     """
-    hourly = df.copy()
-    hourly["EWS"] = compute_ews(hourly)
-    hourly["CWL_hour"] = compute_cwl_hour(hourly["EWS"])
-    hourly["SHWe_hour"] = compute_shwe_hour(hourly["EWS"])
+    # Work on the raw float64 buffers and attach the results in one assign
+    w = df["wind_speed_ms"].to_numpy(dtype=np.float64)
+    g = df["gust_ms"].to_numpy(dtype=np.float64)
+    in_recovery = _recovery_mask(df.index)
+
+    if njit is not None:
+        n = len(df)
+        ews, cwl, shwe = np.empty(n), np.empty(n), np.empty(n)
+        _ews_cwl_shwe(w, g, in_recovery, ews, cwl, shwe)
+    else:
+        ews = w + 0.3 * (g - w)
+        cwl = np.maximum(ews - BASELINE_WIND, 0.0)
+        shwe = np.where(in_recovery, np.maximum(ews - BASELINE_RECOVERY, 0.0), 0.0)
+
+    hourly = df.assign(EWS=ews, CWL_hour=cwl, SHWe_hour=shwe)
 
     daily = compute_daily_metrics(hourly)
     return hourly, daily
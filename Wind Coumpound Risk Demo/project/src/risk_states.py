@@ -15,6 +15,7 @@ Nonlinear escalation multiplier
   risk_multiplier = 1 + (CWL / 80) + (SHWe / 40) + (compound_streak * 0.5)
 """
 
+import numpy as np
 import pandas as pd
 
 # Threshold constants
@@ -39,6 +40,28 @@ def classify_risk_state(cwl: float, shwe: float, compound_streak: int) -> str:
     return "Stable"
 
 
+def _tier_state_lut() -> np.ndarray:
+    """
+    27-entry table mapping a packed tier code (cwl_tier * 9 + shwe_tier * 3 +
+    compound_tier, each tier 0/1/2 = below strain / strain / fail) to STATE_NUM.
+    """
+    cwl_levels = (0.0, CWL_STRAIN, CWL_FAIL)
+    shwe_levels = (0.0, SHWE_STRAIN, SHWE_FAIL)
+    compound_levels = (0, COMPOUND_STRAIN, COMPOUND_FAIL)
+    return np.array(
+        [
+            STATE_NUM[classify_risk_state(c, s, k)]
+            for c in cwl_levels
+            for s in shwe_levels
+            for k in compound_levels
+        ],
+        dtype=np.int8,
+    )
+
+
+_STATE_LUT = _tier_state_lut()
+
+
 def risk_multiplier(cwl: float, shwe: float, compound_streak: int) -> float:
     """Nonlinear escalation gauge value."""
     return 1.0 + (cwl / 80.0) + (shwe / 40.0) + (compound_streak * 0.5)
@@ -60,16 +83,19 @@ def compute_risk_states(daily: pd.DataFrame) -> pd.DataFrame:
     """
     out = daily.copy()
 
-    out["risk_state"] = [
-        classify_risk_state(row.daily_CWL, row.daily_SHWe, row.consecutive_compound_cycles)
-        for row in out.itertuples()
-    ]
+    cwl = out["daily_CWL"].to_numpy()
+    shwe = out["daily_SHWe"].to_numpy()
+    cs = out["consecutive_compound_cycles"].to_numpy()
 
-    out["risk_multiplier"] = [
-        risk_multiplier(row.daily_CWL, row.daily_SHWe, row.consecutive_compound_cycles)
-        for row in out.itertuples()
-    ]
+    # Branchless classification: pack the three 0/1/2 tiers and look up the state
+    cwl_tier = (cwl >= CWL_STRAIN).astype(np.int8) + (cwl >= CWL_FAIL)
+    shwe_tier = (shwe >= SHWE_STRAIN).astype(np.int8) + (shwe >= SHWE_FAIL)
+    cs_tier = (cs >= COMPOUND_STRAIN).astype(np.int8) + (cs >= COMPOUND_FAIL)
+    codes = _STATE_LUT[cwl_tier * 9 + shwe_tier * 3 + cs_tier]
 
-    out["risk_state_num"] = out["risk_state"].map(STATE_NUM)
+    # Ordered categorical: int8 codes double as risk_state_num
+    out["risk_state"] = pd.Categorical.from_codes(codes, categories=STATES, ordered=True)
+    out["risk_multiplier"] = 1.0 + (cwl / 80.0) + (shwe / 40.0) + (cs * 0.5)
+    out["risk_state_num"] = out["risk_state"].cat.codes.astype("int8")
 
     return out
@@ -12,15 +12,20 @@ Panel 5 — Nonlinear escalation gauge (risk_multiplier)
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import matplotlib.dates as mdates
 import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+from matplotlib.collections import PolyCollection
 import numpy as np
 import pandas as pd
 
 from risk_states import STATE_COLORS
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 # ── colour palette ─────────────────────────────────────────────────────────────
 C_WIND = "#2196F3"
 C_GUST = "#90CAF9"
@@ -41,15 +46,18 @@ STATE_CMAP = {
 
 def _shade_risk_band(ax: plt.Axes, daily: pd.DataFrame) -> None:
     """Shade background of an axes by daily risk state."""
-    for row in daily.itertuples():
-        color = STATE_CMAP.get(row.risk_state, "#FFFFFF")
-        ax.axvspan(
-            pd.Timestamp(row.Index) - pd.Timedelta(hours=12),
-            pd.Timestamp(row.Index) + pd.Timedelta(hours=12),
-            color=color,
-            alpha=0.12,
-            linewidth=0,
-        )
+    colors = [STATE_CMAP.get(s, "#FFFFFF") for s in daily["risk_state"]]
+    x0 = mdates.date2num(daily.index - pd.Timedelta(hours=12))
+    # one full-height rectangle per day: x in data coords, y in axes coords
+    verts = [[(x, 0.0), (x, 1.0), (x + 1.0, 1.0), (x + 1.0, 0.0)] for x in x0]
+    bands = PolyCollection(
+        verts,
+        facecolors=colors,
+        alpha=0.12,
+        linewidths=0,
+        transform=ax.get_xaxis_transform(),
+    )
+    ax.add_collection(bands, autolim=False)
 
 
 def _legend_patches() -> list[mpatches.Patch]:
@@ -85,6 +93,8 @@ def plot_all(
     -------
     matplotlib.figure.Figure
     """
+    import matplotlib.pyplot as plt  # deferred: pyplot/backend setup is the slow part
+
     fig, axes = plt.subplots(5, 1, figsize=(14, 22), sharex=False)
     fig.suptitle(
         f"{title_prefix} — Extreme Wind Compound Risk Analysis",
@@ -133,15 +143,14 @@ def plot_all(
     ax = axes[3]
     state_num = daily["risk_state_num"].values.astype(float)
     ax.step(daily.index, state_num, where="mid", color="#37474F", linewidth=1.5)
-    for i, row in enumerate(daily.itertuples()):
-        ax.bar(
-            row.Index,
-            1,
-            bottom=row.risk_state_num,
-            width=0.9,
-            color=STATE_CMAP.get(row.risk_state, "#90A4AE"),
-            alpha=0.75,
-        )
+    ax.bar(
+        daily.index,
+        1,
+        bottom=daily["risk_state_num"],
+        width=0.9,
+        color=[STATE_CMAP.get(s, "#90A4AE") for s in daily["risk_state"]],
+        alpha=0.75,
+    )
     ax.set_yticks([0, 1, 2])
     ax.set_yticklabels(["Stable", "Straining", "Failure"])
     ax.set_ylim(-0.1, 3.0)
@@ -172,14 +181,16 @@ def plot_all(
                 daily.index.max() + pd.Timedelta(days=0.5))
 
     fig.autofmt_xdate(rotation=30, ha="right")
-    fig.tight_layout(rect=[0, 0, 1, 0.995])
+    # fixed margins instead of tight_layout / bbox_inches="tight", which each
+    # cost an extra layout/render pass
+    fig.subplots_adjust(left=0.06, right=0.985, top=0.965, bottom=0.04, hspace=0.2)
 
     if output_dir is not None:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         safe_prefix = title_prefix.replace(" ", "_").replace("/", "-")
         out_path = output_dir / f"{safe_prefix}_panels.png"
-        fig.savefig(out_path, dpi=150, bbox_inches="tight")
+        fig.savefig(out_path, dpi=150)
         print(f"  ✔ Saved figure → {out_path}")
 
     return fig